@@ -28,11 +28,11 @@ SOC decreases linearly with discharge current:
     Continuous form:
         SOC(t) = SOC₀ - (1 / Q) ∫₀ᵗ I(τ) dτ
 
-    Discrete form (numerical):
-        SOCₖ₊₁ = SOCₖ - (I * Δt) / (Q * 3600)
+    Closed form for constant current (used in the simulation):
+        SOC(t) = SOC₀ - I * t / (3600 * Q),   clipped at 0
 
 Where:
-    - Δt is the timestep in seconds
+    - t is the time in seconds, sampled every Δt seconds
     - 3600 converts hours to seconds
 
 ------------------------------------------------------
@@ -75,36 +75,36 @@ t_end = 3600         # Total time in seconds (1 hour)
 dt = 1               # Time step in seconds
 n_steps = int(t_end / dt)
 
-# Initialize arrays
-time = np.zeros(n_steps)
-soc = np.zeros(n_steps)
-voc = np.zeros(n_steps)
-vbat = np.zeros(n_steps)
+# Simulation
+def simulate(Q, R_int, I, SOC0, a, b, dt, n_steps):
+    """Return (time, soc, voc, vbat) for a constant-current discharge.
 
-# Initial conditions
-soc[0] = SOC0
-voc[0] = a * soc[0] + b
-vbat[0] = voc[0] - I_discharge * R_int
+    SOC is evaluated from the closed form SOC(t) = SOC₀ - I t / (3600 Q),
+    clipped at 0, on the time grid t = k * dt.
+    """
+    time = np.arange(n_steps, dtype=float) * dt
 
-# Simulation Loop
-for k in range(1, n_steps):
-    # Time update
-    time[k] = time[k-1] + dt
-
-    # SOC update
-    soc[k] = soc[k-1] - (I_discharge * dt) / (Q * 3600)
-    soc[k] = max(soc[k], 0)  # Limit SOC to non-negative values
+    # State of charge (limited to non-negative values)
+    soc = np.maximum(SOC0 - I * time / (Q * 3600.0), 0.0)
 
     # Open Circuit Voltage
-    voc[k] = a * soc[k] + b
+    voc = a * soc + b
 
     # Terminal Voltage
-    vbat[k] = voc[k] - I_discharge * R_int
+    vbat = voc - I * R_int
+
+    return time, soc, voc, vbat
+
+time, soc, voc, vbat = simulate(Q, R_int, I_discharge, SOC0, a, b, dt, n_steps)
+
+# Time axis in minutes, shared by both plots
+t_min = time * (1.0 / 60.0)
 
 # Plot: Terminal Voltage and OCV
 plt.figure(figsize=(10, 6))
-plt.plot(time/60, vbat, label='Terminal Voltage V_bat(t)', color='blue')
-plt.plot(time/60, voc, label='Open Circuit Voltage V_OC(SOC)', color='green', linestyle='--')
+plt.gca().set_prop_cycle(color=['blue', 'green'], linestyle=['-', '--'])
+plt.plot(t_min, np.column_stack([vbat, voc]),
+         label=['Terminal Voltage V_bat(t)', 'Open Circuit Voltage V_OC(SOC)'])
 plt.xlabel('Time (minutes)')
 plt.ylabel('Voltage (V)')
 plt.title('Battery Discharge: Voltage vs Time')
@@ -115,7 +115,7 @@ plt.show()
 
 # Plot: State of Charge
 plt.figure(figsize=(10, 4))
-plt.plot(time/60, soc, label='State of Charge SOC(t)', color='orange')
+plt.plot(t_min, soc, label='State of Charge SOC(t)', color='orange')
 plt.xlabel('Time (minutes)')
 plt.ylabel('SOC (0 to 1)')
 plt.title('Battery Discharge: SOC vs Time')
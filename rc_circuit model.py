@@ -3,7 +3,8 @@ RC Circuit Simulation
 -----------------------------------------------------
 
 This script simulates the charging and discharging of a capacitor in an RC circuit.
-We analyze both numerically (via ODE solver) and analytically.
+Both ODEs below are linear with closed-form solutions, which are evaluated
+directly.
 
 Mathematical Derivation:
 ------------------------
@@ -40,13 +41,12 @@ At t = τ:
     Charging → V_C = 0.63 * V0
     Discharging → V_C = 0.37 * V0
 
-We simulate both scenarios and compare the numerical solution to the analytical one.
+We simulate both scenarios by evaluating these solutions on a time grid.
 
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import odeint
 
 # Constants
 R = 1000           # Resistance (ohms)
@@ -57,23 +57,12 @@ tau = R * C        # Time constant (seconds)
 # Time array (up to 5 time constants)
 t = np.linspace(0, 5 * tau, 1000)
 
-# Charging phase ODE
-def charging_eq(V, t, R, C, V0):
-    return (V0 - V) / (R * C)
-
-# Initial voltage (uncharged capacitor)
-V_init = 0
-
-# Solve numerically
-V_charge_numerical = odeint(charging_eq, V_init, t, args=(R, C, V0)).flatten()
-
-# Analytical solution
+# Charging from an uncharged capacitor: analytical solution of (1)
 V_charge_analytical = V0 * (1 - np.exp(-t / tau))
 
 # Plot charging
 plt.figure(figsize=(10, 5))
-plt.plot(t, V_charge_numerical, 'b', label='Numerical (ODE)')
-plt.plot(t, V_charge_analytical, 'r--', label='Analytical')
+plt.plot(t, V_charge_analytical, 'b', label='Analytical')
 plt.title('RC Circuit: Capacitor Charging')
 plt.xlabel('Time (s)')
 plt.ylabel('Voltage across Capacitor (V)')
@@ -82,20 +71,12 @@ plt.grid(True)
 plt.tight_layout()
 plt.show()
 
-# Discharging phase ODE
-def discharging_eq(V, t, R, C):
-    return -V / (R * C)
-
-# Solve numerically from V0
-V_discharge_numerical = odeint(discharging_eq, V0, t, args=(R, C)).flatten()
-
-# Analytical solution
+# Discharging from V0: analytical solution of (2)
 V_discharge_analytical = V0 * np.exp(-t / tau)
 
 # Plot discharging
 plt.figure(figsize=(10, 5))
-plt.plot(t, V_discharge_numerical, 'g', label='Numerical (ODE)')
-plt.plot(t, V_discharge_analytical, 'k--', label='Analytical')
+plt.plot(t, V_discharge_analytical, 'g', label='Analytical')
 plt.title('RC Circuit: Capacitor Discharging')
 plt.xlabel('Time (s)')
 plt.ylabel('Voltage across Capacitor (V)')
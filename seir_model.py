@@ -28,7 +28,7 @@ The SEIR model is defined by:
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import odeint
+from scipy.integrate import solve_ivp
 
 # Total population
 N = 10000
@@ -44,31 +44,41 @@ beta = 0.3       # infection rate per contact
 sigma = 1/5.0    # incubation period = 5 days
 gamma = 1/7.0    # recovery period = 7 days
 
-# Time grid (in days)
-t = np.linspace(0, 160, 160)
+# Time grid (in days): one point per day from day 0 to day 160
+t = np.linspace(0, 160, 161)
 
 # Initial conditions vector
 y0 = S0, E0, I0, R0
 
 # The SEIR model differential equations
-def deriv(y, t, N, beta, sigma, gamma):
-    S, E, I, R = y
-    dSdt = -beta * S * I / N
-    dEdt = beta * S * I / N - sigma * E
+def deriv(t, y, N, beta, sigma, gamma):
+    S, E, I, R = y.tolist()  # Python floats are cheaper than NumPy scalars
+    infection = beta * S * I / N  # new exposures per day, shared by dS and dE
+    dSdt = -infection
+    dEdt = infection - sigma * E
     dIdt = sigma * E - gamma * I
     dRdt = gamma * I
     return dSdt, dEdt, dIdt, dRdt
 
-# Integrate the SEIR equations
-ret = odeint(deriv, y0, t, args=(N, beta, sigma, gamma))
-S, E, I, R = ret.T
+# Jacobian d(dy/dt)/dy for the solver's stiff (BDF) mode
+def jac(t, y, N, beta, sigma, gamma):
+    S, E, I, R = y.tolist()
+    dS = beta * I / N  # d(infection)/dS
+    dI = beta * S / N  # d(infection)/dI
+    return ((-dS,    0.0,   -dI,   0.0),
+            ( dS,  -sigma,   dI,   0.0),
+            (0.0,   sigma, -gamma, 0.0),
+            (0.0,    0.0,   gamma, 0.0))
+
+# Integrate the SEIR equations, reporting the solution only on the time grid
+sol = solve_ivp(deriv, (t[0], t[-1]), y0, method='LSODA', t_eval=t,
+                args=(N, beta, sigma, gamma), jac=jac, rtol=1e-6, atol=1e-8)
+S, E, I, R = sol.y
 
 # Plot the data
 plt.figure(figsize=(10, 6))
-plt.plot(t, S, 'b', label='Susceptible')
-plt.plot(t, E, 'y', label='Exposed')
-plt.plot(t, I, 'r', label='Infected')
-plt.plot(t, R, 'g', label='Recovered')
+plt.gca().set_prop_cycle(color=['b', 'y', 'r', 'g'])
+plt.plot(t, sol.y.T, label=['Susceptible', 'Exposed', 'Infected', 'Recovered'])
 plt.xlabel('Time (days)')
 plt.ylabel('Number of People')
 plt.title('SEIR Epidemic Model Simulation')
@@ -13,11 +13,21 @@ Equations:
     di/dt = (-K_e/L)*ω - (R/L)*i + (1/L)*V(t)
 
 We simulate step input voltage V(t) and plot θ(t).
+
+Because the system is linear and V is constant for t ≥ 0, it can be written
+as dx/dt = A x + B V, whose solution is
+
+    x(t) = e^(A t) x0 + ∫₀ᵗ e^(A s) ds B V
+
+With the eigendecomposition A = P diag(λ) P⁻¹ this is evaluated in closed form:
+
+    x(t) = P [ e^(λ_j t) c_j + φ_j(t) g_j ],   c = P⁻¹ x0,   g = P⁻¹ B V
+
+where φ_j(t) = (e^(λ_j t) - 1) / λ_j, or t for the λ_j = 0 (position) mode.
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import odeint
 
 # Parameters
 J = 0.01    # moment of inertia (kg·m^2)
@@ -26,30 +36,30 @@ K_t = 0.01  # torque constant (N·m/A)
 K_e = 0.01  # back EMF constant (V·s/rad)
 R = 1       # armature resistance (ohm)
 L = 0.5     # armature inductance (H)
+V = 5.0     # step input voltage (V), applied from t = 0
 
-# Input voltage (step)
-def input_voltage(t):
-    return 5.0 if t >= 0 else 0.0  # step from 0 to 5V at t=0
-
-# State derivatives
-def servo_motor_deriv(x, t):
-    theta, omega, i = x
-    V = input_voltage(t)
-    
-    dtheta_dt = omega
-    domega_dt = (-b / J) * omega + (K_t / J) * i
-    di_dt = (-K_e / L) * omega - (R / L) * i + (1 / L) * V
-    
-    return [dtheta_dt, domega_dt, di_dt]
+# State-space form: dx/dt = A x + B V
+A = np.array([[0.0,  1.0,      0.0],
+              [0.0, -b / J,    K_t / J],
+              [0.0, -K_e / L, -R / L]])
+B = np.array([0.0, 0.0, 1 / L])
 
 # Initial conditions: motor at rest
-x0 = [0, 0, 0]
+x0 = np.zeros(3)
 
 # Time vector
 t = np.linspace(0, 2, 1000)  # simulate for 2 seconds
 
-# Solve ODE
-sol = odeint(servo_motor_deriv, x0, t)
+# Modal coordinates: A = P diag(lam) P^-1
+lam, P = np.linalg.eig(A)
+c = np.linalg.solve(P, x0)
+g = np.linalg.solve(P, B * V)
+
+# Evaluate the closed-form solution at every time point at once
+lam_t = np.outer(t, lam)
+zero = np.isclose(lam, 0.0)
+phi = np.where(zero, t[:, None], np.expm1(lam_t) / np.where(zero, 1.0, lam))
+sol = ((np.exp(lam_t) * c + phi * g) @ P.T).real
 
 theta = sol[:, 0]
 omega = sol[:, 1]
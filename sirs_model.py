@@ -26,12 +26,12 @@ The model is governed by the following system of ODEs:
     dI/dt =  β * S * I / N - γ * I
     dR/dt =  γ * I - ξ * R
 
-This code solves the system using `scipy.integrate.odeint` and plots the result using matplotlib.
+This code solves the system using `scipy.integrate.solve_ivp` (LSODA) and plots the result using matplotlib.
 """
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import odeint
+from scipy.integrate import solve_ivp
 
 # Total population, N
 N = 1000
@@ -48,29 +48,40 @@ beta = 0.3    # transmission rate
 gamma = 0.1   # recovery rate
 xi = 0.05     # immunity loss rate (R -> S)
 
-# Time grid (in days)
-t = np.linspace(0, 160, 160)
+# Time grid (in days): one point per day from day 0 to day 160
+t = np.linspace(0, 160, 161)
 
 # SIRS model differential equations
-def deriv(y, t, N, beta, gamma, xi):
-    S, I, R = y
-    dSdt = -beta * S * I / N + xi * R
-    dIdt = beta * S * I / N - gamma * I
-    dRdt = gamma * I - xi * R
+def deriv(t, y, N, beta, gamma, xi):
+    S, I, R = y.tolist()  # Python floats are cheaper than NumPy scalars
+    infection = beta * S * I / N  # new infections per day, shared by dS and dI
+    waning = xi * R               # immunity loss per day, shared by dS and dR
+    dSdt = -infection + waning
+    dIdt = infection - gamma * I
+    dRdt = gamma * I - waning
     return dSdt, dIdt, dRdt
 
+# Jacobian d(dy/dt)/dy for the solver's stiff (BDF) mode
+def jac(t, y, N, beta, gamma, xi):
+    S, I, R = y.tolist()
+    dS = beta * I / N  # d(infection)/dS
+    dI = beta * S / N  # d(infection)/dI
+    return ((-dS,   -dI,          xi),
+            ( dS,    dI - gamma, 0.0),
+            (0.0,    gamma,      -xi))
+
 # Initial conditions vector
 y0 = S0, I0, R0
 
 # Integrate the SIRS equations over the time grid, t
-ret = odeint(deriv, y0, t, args=(N, beta, gamma, xi))
-S, I, R = ret.T
+sol = solve_ivp(deriv, (t[0], t[-1]), y0, method='LSODA', t_eval=t,
+                args=(N, beta, gamma, xi), jac=jac, rtol=1e-6, atol=1e-8)
+S, I, R = sol.y
 
 # Plot the results
 plt.figure(figsize=(10, 6))
-plt.plot(t, S, 'b', label='Susceptible')
-plt.plot(t, I, 'r', label='Infected')
-plt.plot(t, R, 'g', label='Recovered')
+plt.gca().set_prop_cycle(color=['b', 'r', 'g'])
+plt.plot(t, sol.y.T, label=['Susceptible', 'Infected', 'Recovered'])
 plt.xlabel('Time (days)')
 plt.ylabel('Number of individuals')
 plt.title('SIRS Disease Model Simulation')
@@ -22,10 +22,21 @@ Simulation Approach:
 --------------------
 
 We discretize time and simulate increments of Brownian motion \( \Delta W \sim \mathcal{N}(0, \sqrt{\Delta t}) \),
-and compute \( S(t) \) iteratively.
+and compute \( S(t) \) from the step recurrence
+
+    S[i] = S[i-1] * exp((μ - 0.5 * σ²) * Δt + σ * ΔW[i-1])
+
+which factors into a cumulative product of the per-step growth factors:
+
+    S[i] = S0 * ∏_{j<i} exp((μ - 0.5 * σ²) * Δt + σ * ΔW[j])
+
+Many independent paths are simulated, and their Monte Carlo mean is compared
+with the exact expectation E[S(t)] = S0 * exp(μ t).
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -36,25 +47,55 @@ sigma = 0.2     # Volatility (20% annual std dev)
 T = 1.0         # Time horizon in years
 dt = 1/252      # Time step (daily, assuming 252 trading days/year)
 N = int(T/dt)   # Number of time steps
-
-# Time array
-t = np.linspace(0, T, N)
-
-# Generate random Brownian increments
-np.random.seed(42)  # for reproducibility
-dW = np.random.normal(0, np.sqrt(dt), size=N-1)
-
-# Initialize stock price array
-S = np.zeros(N)
-S[0] = S0
-
-# Simulate GBM path
-for i in range(1, N):
-    S[i] = S[i-1] * np.exp((mu - 0.5 * sigma**2) * dt + sigma * dW[i-1])
-
-# Plot the simulated stock price path
+M_paths = 10_000  # Number of simulated Monte Carlo paths
+n_batches = 16    # Number of independent batches of paths (fixed for reproducibility)
+
+# Per-step drift and volatility of log S, constant across all steps and paths:
+#   log S[i] - log S[i-1] = drift + vol * Z[i-1],  Z ~ N(0, 1)
+drift = np.float32((mu - 0.5 * sigma**2) * dt)
+vol = np.float32(sigma * np.sqrt(dt))
+
+# Time array: path column k is at time k * dt
+t = np.arange(N) * dt
+
+# Simulate one batch of GBM paths into the rows of `out` (one path per row).
+# Every step works in place on a single scratch array, so a batch needs no
+# full-size temporaries. Paths are stored in float32 since they are only
+# averaged and plotted.
+def simulate_paths(seed, out):
+    rng = np.random.default_rng(seed)  # independent PCG64 stream per batch
+
+    # Per-step growth factors exp(drift + vol * Z) from standard normals Z
+    incr = rng.standard_normal((out.shape[0], N-1), dtype=np.float32)
+    incr *= vol
+    incr += drift
+    np.exp(incr, out=incr)
+
+    # GBM paths as cumulative products of the growth factors
+    out[:, 0] = S0
+    np.cumprod(incr, axis=1, out=out[:, 1:])
+    out[:, 1:] *= S0
+
+# Independent child seeds for each batch, derived from one master seed
+seeds = np.random.SeedSequence(42).spawn(n_batches)
+
+# Row ranges of S filled by each batch
+bounds = np.linspace(0, M_paths, n_batches + 1).astype(int)
+
+# Simulate all batches in parallel, each writing directly into its rows of S.
+# NumPy releases the GIL in random generation, exp and cumprod, so threads
+# run the batches on multiple cores; the fixed batch count keeps the results
+# independent of the number of cores.
+S = np.empty((M_paths, N), dtype=np.float32)
+with ThreadPoolExecutor() as pool:
+    list(pool.map(simulate_paths, seeds,
+                  [S[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]))
+
+# Plot a sample of the simulated paths and the Monte Carlo mean
 plt.figure(figsize=(10,6))
-plt.plot(t, S, label='Simulated Stock Price')
+plt.plot(t, S[:50].T, color='gray', alpha=0.3, linewidth=0.8)
+plt.plot(t, S.mean(axis=0, dtype=np.float64), 'b', label=f'Monte Carlo mean ({M_paths} paths)')
+plt.plot(t, S0 * np.exp(mu * t), 'r--', label='Expected value S0·exp(μt)')
 plt.xlabel('Time (years)')
 plt.ylabel('Stock Price')
 plt.title('Geometric Brownian Motion Stock Price Simulation')
@@ -0,0 +1,55 @@
+"""
+Growable Trajectory Buffer
+--------------------------
+
+Helper for simulations that record a variable number of rows, e.g. logging a
+state only when it crosses a threshold, where the output length is not known
+before the loop runs.
+
+Growing a NumPy array with np.append / np.vstack copies the whole array on
+every call, which makes recording n rows cost O(n²). Trajectory instead keeps
+a pre-allocated buffer and doubles its capacity when it fills up, so appending
+n rows costs O(n) copies in total.
+
+Usage:
+
+    traj = Trajectory(ncols=3)
+    for k in range(n_steps):
+        ...
+        if soc < threshold:
+            traj.append((time, soc, vbat))
+    data = traj.finalize()   # array of shape (n_rows, 3)
+"""
+
+import numpy as np
+
+
+class Trajectory:
+    """Append-only (n_rows, ncols) float array with amortized O(1) appends."""
+
+    def __init__(self, ncols, chunk=128):
+        if chunk < 1:
+            raise ValueError(f"chunk must be at least 1, got {chunk}")
+        self._buf = np.empty((chunk, ncols))
+        self._n = 0
+
+    def __len__(self):
+        return self._n
+
+    def append(self, row):
+        """Append one row of ncols values, doubling the buffer when full."""
+        row = np.asarray(row)
+        if row.shape != (self._buf.shape[1],):
+            raise ValueError(f"row must have shape ({self._buf.shape[1]},), "
+                             f"got {row.shape}")
+        if self._n == self._buf.shape[0]:
+            grown = np.empty((2 * self._buf.shape[0], self._buf.shape[1]),
+                             dtype=self._buf.dtype)
+            grown[:self._n] = self._buf
+            self._buf = grown
+        self._buf[self._n] = row
+        self._n += 1
+
+    def finalize(self):
+        """Return the recorded rows as an (n_rows, ncols) array view."""
+        return self._buf[:self._n]